@@ -21,23 +21,29 @@ Args:
 
 import argparse
 import enum
+import functools
 import os
+import re
 import shutil
 import sys
 from pathlib import Path
-from subprocess import DEVNULL, PIPE, Popen
+from subprocess import run
 from typing import Callable, Optional, cast
 
 from PyQt6.QtCore import (
+    QBuffer,
+    QByteArray,
+    QEvent,
+    QIODevice,
+    QLine,
     QObject,
     QPoint,
+    QProcess,
     QRect,
     QSize,
     Qt,
-    QThread,
     QTimer,
     QUrl,
-    pyqtSignal,
 )
 from PyQt6.QtGui import (
     QBrush,
@@ -45,13 +51,14 @@ from PyQt6.QtGui import (
     QColor,
     QColorConstants,
     QIcon,
+    QImageReader,
     QKeyEvent,
     QMouseEvent,
     QMoveEvent,
-    QMovie,
     QPainter,
     QPaintEvent,
     QPen,
+    QPixmap,
     QResizeEvent,
 )
 from PyQt6.QtMultimedia import QMediaMetaData, QMediaPlayer
@@ -75,9 +82,24 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-TMP_MP4_TRIM_FILE = Path("/tmp/gif_extractor_trimmed.mp4")
-TMP_PREVIEW_FILE = Path("/tmp/gif_extractor_preview.gif")
-TMP_OUTPUT_FILE = Path("/tmp/gif_extractor_output.gif")
+# Intermediate files are kept in memory-backed /dev/shm when available
+TMP_DIR = Path("/dev/shm") if os.access("/dev/shm", os.W_OK) else Path("/tmp")
+TMP_OUTPUT_FILE = TMP_DIR / "gif_extractor_output.gif"
+TMP_PALETTE_FILE = TMP_DIR / "gif_extractor_palette.png"
+
+# Minimum overlap between two crops of the same clip to reuse the palette of the first one
+PALETTE_REUSE_OVERLAP = 0.9
+
+# Translucent overlay colors, built once instead of mutating the shared QColorConstants
+SELECTION_COLOR = QColor(255, 255, 255, 102)
+VALIDATED_COLOR = QColor(0, 255, 0, 51)
+
+# Values parsed from the key=value lines of ffmpeg's `-progress` output
+PROGRESS_RE = re.compile(rb"^(frame|fps)=([\d.]+)$", re.MULTILINE)
+
+# Thumbnails shown when hovering the progress bar, decoded in a single ffmpeg pass
+THUMBNAIL_COUNT = 100
+THUMBNAIL_WIDTH = 160
 
 
 def parseArgs() -> argparse.Namespace:
@@ -86,13 +108,47 @@ def parseArgs() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def getHwaccelArgs() -> list[str]:
+    """Return the ffmpeg arguments enabling hardware decoding, if ffmpeg was built with any method."""
+    try:
+        result = run(["ffmpeg", "-hide_banner", "-hwaccels"], capture_output=True, text=True, check=False)
+    except OSError:
+        return []
+
+    # Output is a "Hardware acceleration methods:" header followed by one method per line
+    hwaccels = [line.strip() for line in result.stdout.splitlines()[1:] if line.strip()]
+
+    # The list only tells which methods are compiled in, not which devices exist: `auto`
+    # falls back to software decoding when no device can be created instead of failing
+    if result.returncode == 0 and hwaccels:
+        return ["-hwaccel", "auto"]
+    return []
+
+
+@functools.lru_cache(maxsize=8192)
 def format_time(seconds: int) -> str:
     """Format time in seconds to MM:SS or HH:MM:SS format."""
     hours, remainder = divmod(seconds, 3600)
     minutes, seconds = divmod(remainder, 60)
     if hours > 0:
-        return f"{hours:02}:{minutes:02}:{seconds:02}"
-    return f"{minutes:02}:{seconds:02}"
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def format_ffmpeg_time(milliseconds: int) -> str:
+    """Format time in milliseconds to the S.mmm format understood by ffmpeg."""
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{seconds}.{milliseconds:03d}"
+
+
+def lowPriority(cmd: list[str]) -> list[str]:
+    """
+    Start long-running jobs with `nice` so they use the idle cores without competing with the playback.
+    The prefix is skipped when the program is missing so that it still fails to start with an explicit error.
+    """
+    if shutil.which("nice") is None or shutil.which(cmd[0]) is None:
+        return cmd
+    return ["nice", "-n", "10", *cmd]
 
 
 class TickSlider(QSlider):
@@ -120,16 +176,89 @@ class TickSlider(QSlider):
         self.moveCb = moveCb
         self.releaseCb = releaseCb
 
+        self.startTickPen = QPen(QColorConstants.Green, 2)
+        self.endTickPen = QPen(QColorConstants.Red, 2)
+
+        # Style geometry used to draw ticks and to map clicks to values,
+        # only recomputed when the widget is resized or restyled
+        self.tickGeometry: Optional[tuple[int, int, int, int, int]] = None
+        self.clickGeometry: Optional[tuple[QPoint, int, int, bool, bool]] = None
+
+        # Video thumbnails evenly spread over the slider range, shown on hover
+        self.thumbnails: list[QPixmap] = []
+        self.thumbnailCount = THUMBNAIL_COUNT
+        self.thumbnailIndex = -1
+        self.thumbnailPopup = QLabel(self, Qt.WindowType.ToolTip)
+        self.setMouseTracking(True)
+
     def setStartTick(self) -> None:
+        self.updateTick(self.startTick)
         self.startTick = self.value()
+        self.updateTick(self.startTick)
 
     def setEndTick(self) -> None:
+        self.updateTick(self.endTick)
         self.endTick = self.value()
+        self.updateTick(self.endTick)
 
     def clearTicks(self) -> None:
+        self.updateTick(self.startTick)
+        self.updateTick(self.endTick)
         self.startTick = None
         self.endTick = None
 
+    def tickPos(self, value: int) -> int:
+        """Returns the x coordinate of a tick, relative to the xOffset of the tick geometry"""
+        _, span, _, _, _ = cast(tuple[int, int, int, int, int], self.tickGeometry)
+        sliderMin = self.minimum()
+        return int((value - sliderMin) * (span / max(1, self.maximum() - sliderMin)))
+
+    def updateTick(self, value: Optional[int]) -> None:
+        """Only repaint the band covered by the tick at the given value"""
+        if value is None:
+            return
+
+        if self.tickGeometry is None:
+            style = self.style()
+            if style is None:
+                return
+            opt = QStyleOptionSlider()
+            self.initStyleOption(opt)
+            self.tickGeometry = self.computeTickGeometry(style, opt)
+        xOffset, _, _, _, bottom = self.tickGeometry
+        self.update(QRect(xOffset + self.tickPos(value) - 2, 0, 4, bottom))
+
+    def clearThumbnails(self) -> None:
+        self.thumbnails = []
+        self.thumbnailCount = THUMBNAIL_COUNT
+        self.hideThumbnail()
+
+    def showThumbnail(self, pos: QPoint) -> None:
+        """Show the thumbnail closest to the hovered value above the slider"""
+        if not self.thumbnails:
+            return
+
+        val = self.pixelPosToRangeValue(pos)
+        if val is None:
+            return
+        sliderMin = self.minimum()
+        index = (val - sliderMin) * self.thumbnailCount // (self.maximum() - sliderMin + 1)
+        if not 0 <= index < len(self.thumbnails):
+            self.hideThumbnail()
+            return
+
+        pixmap = self.thumbnails[index]
+        if index != self.thumbnailIndex:
+            self.thumbnailIndex = index
+            self.thumbnailPopup.setPixmap(pixmap)
+            self.thumbnailPopup.resize(pixmap.size())
+        self.thumbnailPopup.move(self.mapToGlobal(QPoint(pos.x() - pixmap.width() // 2, -pixmap.height() - 4)))
+        self.thumbnailPopup.show()
+
+    def hideThumbnail(self) -> None:
+        self.thumbnailIndex = -1
+        self.thumbnailPopup.hide()
+
     def mousePressEvent(self, ev: Optional[QMouseEvent]) -> None:
         if ev is None or ev.button() != Qt.MouseButton.LeftButton:
             return
@@ -143,10 +272,14 @@ class TickSlider(QSlider):
             self.moveCb()
 
     def mouseMoveEvent(self, ev: Optional[QMouseEvent]) -> None:
-        if ev is None or not self.hasClickedSlider:
+        if ev is None:
             return
 
-        super().mousePressEvent(ev)
+        self.showThumbnail(ev.pos())
+        if not self.hasClickedSlider:
+            return
+
+        super().mouseMoveEvent(ev)
         val = self.pixelPosToRangeValue(ev.pos())
         if val is not None:
             self.setValue(val)
@@ -160,7 +293,8 @@ class TickSlider(QSlider):
         self.hasClickedSlider = False
         self.releaseCb()
 
-    def pixelPosToRangeValue(self, pos: QPoint) -> Optional[int]:
+    def computeClickGeometry(self) -> Optional[tuple[QPoint, int, int, bool, bool]]:
+        """Returns the (handleOffset, sliderMin, sliderSpan, upsideDown, horizontal) values mapping clicks to values"""
         opt = QStyleOptionSlider()
         style = self.style()
         if style is None:
@@ -170,7 +304,8 @@ class TickSlider(QSlider):
         gr = style.subControlRect(QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderGroove, self)
         sr = style.subControlRect(QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderHandle, self)
 
-        if self.orientation() == Qt.Orientation.Horizontal:
+        horizontal = self.orientation() == Qt.Orientation.Horizontal
+        if horizontal:
             sliderLength = sr.width()
             sliderMin = gr.x()
             sliderMax = gr.right() - sliderLength + 1
@@ -178,12 +313,48 @@ class TickSlider(QSlider):
             sliderLength = sr.height()
             sliderMin = gr.y()
             sliderMax = gr.bottom() - sliderLength + 1
-        pr = pos - sr.center() + sr.topLeft()
-        p = pr.x() if self.orientation() == Qt.Orientation.Horizontal else pr.y()
+        return sr.center() - sr.topLeft(), sliderMin, sliderMax - sliderMin, opt.upsideDown, horizontal
+
+    def pixelPosToRangeValue(self, pos: QPoint) -> Optional[int]:
+        if self.clickGeometry is None:
+            self.clickGeometry = self.computeClickGeometry()
+            if self.clickGeometry is None:
+                return None
+        handleOffset, sliderMin, sliderSpan, upsideDown, horizontal = self.clickGeometry
+
+        pr = pos - handleOffset
+        p = pr.x() if horizontal else pr.y()
         return QStyle.sliderValueFromPosition(
-            self.minimum(), self.maximum(), p - sliderMin, sliderMax - sliderMin, opt.upsideDown,
+            self.minimum(), self.maximum(), p - sliderMin, sliderSpan, upsideDown,
         )
 
+    def leaveEvent(self, a0: Optional[QEvent]) -> None:
+        self.hideThumbnail()
+        super().leaveEvent(a0)
+
+    def resizeEvent(self, ev: Optional[QResizeEvent]) -> None:
+        self.tickGeometry = None
+        self.clickGeometry = None
+        super().resizeEvent(ev)
+
+    def changeEvent(self, ev: Optional[QEvent]) -> None:
+        if ev is not None and ev.type() in (
+            QEvent.Type.StyleChange, QEvent.Type.FontChange, QEvent.Type.LayoutDirectionChange,
+        ):
+            self.tickGeometry = None
+            self.clickGeometry = None
+        super().changeEvent(ev)
+
+    def computeTickGeometry(self, style: QStyle, opt: QStyleOptionSlider) -> tuple[int, int, int, int, int]:
+        """Returns the (xOffset, span, grooveTop, grooveBottom, bottom) values used to draw ticks"""
+        sliderLength = style.pixelMetric(QStyle.PixelMetric.PM_SliderLength, opt, self)
+        span = style.pixelMetric(QStyle.PixelMetric.PM_SliderSpaceAvailable, opt, self)
+        grooveRect = style.subControlRect(
+            QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderGroove,
+        )
+        xOffset = opt.rect.x() + sliderLength // 2
+        return xOffset, span, grooveRect.top(), grooveRect.bottom(), self.height()
+
     def paintEvent(self, ev: Optional[QPaintEvent]) -> None:
         """Override painting to add ticks on startTick and endTick positions"""
         if self.startTick is None and self.endTick is None:
@@ -201,33 +372,29 @@ class TickSlider(QSlider):
         opt.subControls = QStyle.SubControl.SC_SliderGroove
         qp.drawComplexControl(QStyle.ComplexControl.CC_Slider, opt)
 
-        sliderMin = self.minimum()
-        sliderMax = self.maximum()
-        sliderLength = style.pixelMetric(QStyle.PixelMetric.PM_SliderLength, opt, self)
-        span = style.pixelMetric(QStyle.PixelMetric.PM_SliderSpaceAvailable, opt, self)
+        if self.tickGeometry is None:
+            self.tickGeometry = self.computeTickGeometry(style, opt)
+        xOffset, _, grooveTop, grooveBottom, bottom = self.tickGeometry
+
+        # Ticks outside of the repainted region are skipped
+        region = ev.region() if ev is not None else None
 
         qp.save()
-        qp.translate(opt.rect.x() + sliderLength / 2, 0)
-        grooveRect = style.subControlRect(
-            QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderGroove,
-        )
-        grooveTop = grooveRect.top()
-        grooveBottom = grooveRect.bottom()
-        bottom = self.height()
+        qp.translate(xOffset, 0)
 
         # Draw start tick
         if self.startTick is not None:
-            qp.setPen(QPen(QColorConstants.Green, 2))
-            x = style.sliderPositionFromValue(sliderMin, sliderMax, self.startTick, span)
-            qp.drawLine(x, 0, x, grooveTop)
-            qp.drawLine(x, grooveBottom, x, bottom)
+            x = self.tickPos(self.startTick)
+            if region is None or region.intersects(QRect(xOffset + x - 2, 0, 4, bottom)):
+                qp.setPen(self.startTickPen)
+                qp.drawLines([QLine(x, 0, x, grooveTop), QLine(x, grooveBottom, x, bottom)])
 
         # Draw end tick
         if self.endTick is not None:
-            qp.setPen(QPen(QColorConstants.Red, 2))
-            x = style.sliderPositionFromValue(sliderMin, sliderMax, self.endTick, span)
-            qp.drawLine(x, 0, x, grooveTop)
-            qp.drawLine(x, grooveBottom, x, bottom)
+            x = self.tickPos(self.endTick)
+            if region is None or region.intersects(QRect(xOffset + x - 2, 0, 4, bottom)):
+                qp.setPen(self.endTickPen)
+                qp.drawLines([QLine(x, 0, x, grooveTop), QLine(x, grooveBottom, x, bottom)])
 
         qp.restore()
 
@@ -254,18 +421,50 @@ class SelectionWindow(QWidget):
 
         self.startPos: Optional[QPoint] = None
         self.endPos: Optional[QPoint] = None
+        self.selectionRect: Optional[QRect] = None
+        self.paintedRect: Optional[QRect] = None
         self.validatedSel: Optional[QRect] = None
 
+        # Brushes are built once as paintEvent is called on every mouse move
+        self.selectionBrush = QBrush(SELECTION_COLOR)
+        self.validatedBrush = QBrush(VALIDATED_COLOR)
+
+    def setStartPos(self, pos: Optional[QPoint]) -> None:
+        self.startPos = pos
+        self.selectionRect = self.computeRect()
+
+    def setEndPos(self, pos: Optional[QPoint]) -> None:
+        self.endPos = pos
+        self.selectionRect = self.computeRect()
+
     def getRect(self) -> Optional[QRect]:
         """Returns the selected crop area as a QRect, or None if not selected."""
+        return self.selectionRect
+
+    def computeRect(self) -> Optional[QRect]:
         if self.startPos is None or self.endPos is None:
             return None
 
-        x1 = min(self.startPos.x(), self.endPos.x()) - 10
-        x2 = max(self.startPos.x(), self.endPos.x()) - 10
-        y1 = min(self.startPos.y(), self.endPos.y()) - 10
-        y2 = max(self.startPos.y(), self.endPos.y()) - 10
-        return QRect(QPoint(x1, y1), QPoint(x2, y2))
+        sx, sy = self.startPos.x(), self.startPos.y()
+        ex, ey = self.endPos.x(), self.endPos.y()
+        if sx > ex:
+            sx, ex = ex, sx
+        if sy > ey:
+            sy, ey = ey, sy
+        return QRect(sx - 10, sy - 10, ex - sx + 1, ey - sy + 1)
+
+    def updateSelection(self) -> None:
+        """Repaint only the area covered by the previously painted, the current and the validated selections"""
+        rect = self.selectionRect
+        dirty: Optional[QRect] = None
+        for area in (rect, self.paintedRect, self.validatedSel):
+            if area is not None:
+                dirty = area if dirty is None else dirty.united(area)
+        self.paintedRect = rect
+
+        # Account for the width of the pen
+        if dirty is not None:
+            self.update(dirty.adjusted(-2, -2, 2, 2))
 
     def validate(self) -> None:
         self.validatedSel = self.getRect()
@@ -273,24 +472,16 @@ class SelectionWindow(QWidget):
     def paintEvent(self, a0: Optional[QPaintEvent]) -> None:
         """Draws a translucent rectangle to show the selected crop area."""
         del a0
-        selectionRect = self.getRect()
-        if selectionRect is None:
+        if self.selectionRect is None:
             return
 
+        # Plain fills cover the same area as the former 2px outline without stroking it
         painter = QPainter(self)
-        color = cast(QColor, QColorConstants.White)
-        color.setAlphaF(0.4)
-        painter.setPen(QPen(color, 2))
-        painter.setBrush(QBrush(color))
-        painter.drawRect(selectionRect)
+        painter.fillRect(self.selectionRect.adjusted(-1, -1, 1, 1), self.selectionBrush)
 
         # Draw translucent green rectangle for validated selection
         if self.validatedSel is not None:
-            color = cast(QColor, QColorConstants.Green)
-            color.setAlphaF(0.2)
-            painter.setPen(QPen(color, 2))
-            painter.setBrush(QBrush(color))
-            painter.drawRect(self.validatedSel)
+            painter.fillRect(self.validatedSel.adjusted(-1, -1, 1, 1), self.validatedBrush)
 
         painter.end()
 
@@ -300,6 +491,8 @@ class SelectionWindow(QWidget):
     def clearSelection(self) -> None:
         self.startPos = None
         self.endPos = None
+        self.selectionRect = None
+        self.paintedRect = None
         self.validatedSel = None
         self.update()
 
@@ -307,6 +500,7 @@ class SelectionWindow(QWidget):
 class PreviewWindow(QWidget):
     """
     Overlay widget to show a preview of the selected crop area.
+    The GIF frames are decoded at the window size when loaded or resized, then cycled by a timer.
     """
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
@@ -318,44 +512,99 @@ class PreviewWindow(QWidget):
         self.label = QLabel(self)
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.label.resize(self.size())
-        self.label.setScaledContents(True)
-        self.movie: Optional[QMovie] = None
+
+        # Frames are only kept decoded at the window size, the GIF data is kept to decode them again on resize
+        self.gifData = b""
+        self.gifSize = QSize()
+        self.scaledFrames: list[QPixmap] = []
+        self.delays: list[int] = []
+        self.frameIndex = 0
+        self.frameTimer = QTimer(self)
+        self.frameTimer.setSingleShot(True)
+        self.frameTimer.timeout.connect(self.nextFrame)
 
     def resizeEvent(self, a0: Optional[QResizeEvent]) -> None:
         self.label.resize(self.size())
+        if self.scaledFrames and self.scaledFrames[0].size() != self.size():
+            self.decodeFrames()
         if a0:
             a0.accept()
 
+    def decodeFrames(self) -> None:
+        """Decode all the GIF frames directly at the window size"""
+        buffer = QBuffer()
+        reader = self.gifReader(buffer)
+        reader.setScaledSize(self.size())
+
+        self.scaledFrames = []
+        self.delays = []
+        image = reader.read()
+        while not image.isNull():
+            self.scaledFrames.append(QPixmap.fromImage(image))
+            self.delays.append(max(10, reader.nextImageDelay()))
+            image = reader.read()
+
+        if self.scaledFrames:
+            self.frameIndex %= len(self.scaledFrames)
+            self.label.setPixmap(self.scaledFrames[self.frameIndex])
+
+    def gifReader(self, buffer: QBuffer) -> QImageReader:
+        """Returns a reader on the GIF data, the buffer must outlive it"""
+        buffer.setData(QByteArray(self.gifData))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        return QImageReader(buffer, QByteArray(b"gif"))
+
     def hasMedia(self) -> bool:
-        return self.movie is not None
+        return not self.gifSize.isEmpty()
 
-    def loadGif(self, path: str) -> None:
+    def loadGif(self, data: bytes) -> None:
+        """Only read the GIF size so the window can be fitted to it before `play` decodes the frames"""
         self.stop()
-        self.movie = QMovie(path)
-        self.label.setMovie(self.movie)
-        self.movie.start()
+        self.gifData = data
+        buffer = QBuffer()
+        self.gifSize = self.gifReader(buffer).size()
+
+    def play(self) -> None:
+        """Decode the frames of the loaded GIF at the window size and start cycling them"""
+        if not self.hasMedia():
+            return
+
+        self.decodeFrames()
+        if self.scaledFrames:
+            self.frameTimer.start(self.delays[0])
+
+    def nextFrame(self) -> None:
+        if not self.scaledFrames:
+            return
+
+        self.frameIndex = (self.frameIndex + 1) % len(self.scaledFrames)
+        self.label.setPixmap(self.scaledFrames[self.frameIndex])
+        self.frameTimer.start(self.delays[self.frameIndex])
 
     def getSize(self) -> tuple[int, int]:
-        if self.movie is None:
+        if not self.hasMedia():
             return (-1, -1)
-        frame = self.movie.currentPixmap()
-        return frame.width(), frame.height()
+        return self.gifSize.width(), self.gifSize.height()
 
     def toggle(self) -> None:
-        if self.movie is None:
+        if not self.scaledFrames:
             return
 
         if self.isVisible():
-            self.movie.stop()
+            self.frameTimer.stop()
             self.hide()
         else:
-            self.movie.start()
+            self.frameTimer.start(self.delays[self.frameIndex])
             self.show()
 
     def stop(self) -> None:
-        if self.movie is not None:
-            self.movie.stop()
-            self.movie = None
+        self.frameTimer.stop()
+        self.gifData = b""
+        self.gifSize = QSize()
+        self.scaledFrames.clear()
+        self.delays.clear()
+        self.frameIndex = 0
+        self.label.clear()
 
 
 class WorkerStatus(enum.Enum):
@@ -364,90 +613,116 @@ class WorkerStatus(enum.Enum):
     ERROR = enum.auto()
 
 
-class Worker(QObject):
-    taskProgress = pyqtSignal(int, float)
-    taskFinished = pyqtSignal(WorkerStatus, str)
-
-    def __init__(self, cmd: list[str]) -> None:
-        super().__init__()
-        self.process: Optional[Popen] = None
-        self.cmd = cmd
-        self.interrupt = False
-
-    def run(self) -> None:
-        try:
-            if "-progress" in self.cmd:
-                self.process = Popen(self.cmd, stdout=PIPE, stderr=DEVNULL)
-                if self.process.stdout is not None:
-                    savedFrame = 0
-                    for data in iter(self.process.stdout.readline, b""):
-                        if data.startswith(b"frame="):
-                            savedFrame = int(data[6:])
-                        elif data.startswith(b"fps="):
-                            self.taskProgress.emit(savedFrame, float(data[4:]))
-                self.process.wait()
-            else:
-                self.process = Popen(self.cmd, stdout=DEVNULL, stderr=DEVNULL)
-                self.process.wait()
-
-            if self.interrupt:
-                return
-
-            if self.process.returncode == 0:
-                self.taskFinished.emit(WorkerStatus.SUCCESS, "")
-            else:
-                self.taskFinished.emit(WorkerStatus.FAILURE, "")
-
-        except Exception as e:
-            self.taskFinished.emit(WorkerStatus.ERROR, f"Exception during process: {e}")
-
-        finally:
-            self.process = None
-
-    def stop(self) -> None:
-        if self.process is not None:
-            self.interrupt = True
-            self.process.terminate()
-
+class WorkerRunner(QObject):
+    """
+    Run commands asynchronously through a QProcess driven by the Qt event loop.
+    Starting a new command kills the previous one, whose signals are then ignored.
+    """
 
-class WorkerRunner:
     def __init__(
         self,
         callback: Callable[[WorkerStatus, str], None],
         progressCallback: Optional[Callable[[int, float], None]] = None,
+        outputCallback: Optional[Callable[[bytes], None]] = None,
     ) -> None:
-        self.thread = QThread()
-        self.worker: Optional[Worker] = None
+        super().__init__()
         self.callback = callback
         self.progressCallback = progressCallback
+        self.outputCallback = outputCallback
+        self.process: Optional[QProcess] = None
+        self.progressBuffer = bytearray()
 
-    def interrupt(self) -> None:
-        if self.worker is not None:
-            self.thread.started.disconnect()
-            self.worker.stop()
-            self.worker = None
+    def isRunning(self) -> bool:
+        return self.process is not None
 
-        self.thread.quit()
-        self.thread.wait()
+    def interrupt(self) -> None:
+        process = self.process
+        self.process = None
+        if process is not None and process.state() != QProcess.ProcessState.NotRunning:
+            process.kill()
 
     def run(self, cmd: list[str]) -> None:
         self.interrupt()
 
-        self.worker = Worker(cmd)
-        self.worker.moveToThread(self.thread)
+        process = QProcess(self)
+        process.setStandardInputFile(QProcess.nullDevice())
+        process.setStandardErrorFile(QProcess.nullDevice())
+        if self.outputCallback is not None:
+            process.readyReadStandardOutput.connect(lambda: self.onOutput(process))
+        elif "-progress" in cmd:
+            self.progressBuffer = bytearray()
+            process.readyReadStandardOutput.connect(lambda: self.onReadyRead(process))
+        else:
+            process.setStandardOutputFile(QProcess.nullDevice())
+        process.finished.connect(lambda exitCode, exitStatus: self.onFinished(process, exitCode, exitStatus))
+        process.errorOccurred.connect(lambda error: self.onError(process, error))
+
+        self.process = process
+        process.start(cmd[0], cmd[1:])
+
+    def onReadyRead(self, process: QProcess) -> None:
+        if process is not self.process:
+            return
+
+        # Read everything available at once and only parse complete blocks,
+        # each of them being terminated by a `progress=continue|end` line
+        self.progressBuffer += process.readAllStandardOutput().data()
+        start = self.progressBuffer.rfind(b"progress=")
+        end = self.progressBuffer.find(b"\n", start) + 1 if start >= 0 else 0
+        if end == 0:
+            return
+        data = bytes(self.progressBuffer[:end])
+        del self.progressBuffer[:end]
+
+        # Only report the latest values when several blocks were read together
+        frame: Optional[int] = None
+        fps: Optional[float] = None
+        for key, value in PROGRESS_RE.findall(data):
+            if key == b"frame":
+                frame = int(value)
+            else:
+                fps = float(value)
+        if frame is not None and fps is not None and self.progressCallback is not None:
+            self.progressCallback(frame, fps)
+
+    def onOutput(self, process: QProcess) -> None:
+        if process is not self.process or self.outputCallback is None:
+            return
+
+        data = process.readAllStandardOutput().data()
+        if data:
+            self.outputCallback(data)
+
+    def onFinished(self, process: QProcess, exitCode: int, exitStatus: QProcess.ExitStatus) -> None:
+        process.deleteLater()
+        if process is not self.process:
+            return
+
+        # Forward output that arrived after the last readyRead signal
+        self.onOutput(process)
+        self.process = None
+        if exitStatus == QProcess.ExitStatus.NormalExit and exitCode == 0:
+            self.callback(WorkerStatus.SUCCESS, "")
+        else:
+            self.callback(WorkerStatus.FAILURE, "")
+
+    def onError(self, process: QProcess, error: QProcess.ProcessError) -> None:
+        # Other errors are followed by the `finished` signal
+        if error != QProcess.ProcessError.FailedToStart:
+            return
 
-        self.thread.started.connect(self.worker.run)
-        self.worker.taskFinished.connect(self.callback)
-        self.worker.taskFinished.connect(self.interrupt)
-        if self.progressCallback is not None:
-            self.worker.taskProgress.connect(self.progressCallback)
+        process.deleteLater()
+        if process is not self.process:
+            return
 
-        if not self.thread.isRunning():
-            self.thread.start()
+        self.process = None
+        self.callback(WorkerStatus.ERROR, f"Exception during process: {process.errorString()}")
 
     def close(self) -> None:
+        process = self.process
         self.interrupt()
-        self.thread.deleteLater()
+        if process is not None:
+            process.waitForFinished(1000)
 
 
 class HelpBox(QMessageBox):
@@ -472,12 +747,19 @@ class VideoPlayer(QMainWindow):
         self.mediaPlayer.setVideoOutput(self.videoWidget)
         self.mediaPlayer.mediaStatusChanged[QMediaPlayer.MediaStatus].connect(self.mediaLoaded)
         self.videoTrueGeometry = QRect()
-
-        self.extractionRunning = False
-        self.trimWorker = WorkerRunner(self.onTrimFinished)
-        self.previewWorker = WorkerRunner(self.onPreviewFinished)
+        self.videoBounds = (0, 0, 0, 0)
+        self.blackBarsKey: Optional[tuple[int, int, int, int]] = None
+        self.widthRatio = 1.0
+        self.heightRatio = 1.0
+
+        self.hwaccelArgs = getHwaccelArgs()
+        self.previewWorker = WorkerRunner(self.onPreviewFinished, outputCallback=self.onPreviewData)
+        self.previewData = bytearray()
         self.conversionWorker = WorkerRunner(self.onConversionFinished, self.onConversionProgress)
         self.optimizationWorker = WorkerRunner(self.onOptimizationFinished)
+        self.thumbnailWorker = WorkerRunner(self.onThumbnailsFinished, outputCallback=self.onThumbnailData)
+        self.thumbnailData = bytearray()
+        self.workers = [self.previewWorker, self.conversionWorker, self.optimizationWorker, self.thumbnailWorker]
 
         # Overlays for selection and preview
         self.previewEnabled = True
@@ -486,16 +768,71 @@ class VideoPlayer(QMainWindow):
         self.previewAnchor: Optional[QPoint] = None
         self.clickPreviewVec: Optional[QPoint] = None
 
+        # Coalesce overlay updates during mouse drags to at most one every 8ms
+        self.selectionUpdateTimer = QTimer(self)
+        self.selectionUpdateTimer.setSingleShot(True)
+        self.selectionUpdateTimer.setInterval(8)
+        self.selectionUpdateTimer.timeout.connect(self.selectionWindow.updateSelection)
+        self.previewMoveTimer = QTimer(self)
+        self.previewMoveTimer.setSingleShot(True)
+        self.previewMoveTimer.setInterval(8)
+        self.previewMoveTimer.timeout.connect(self.movePreview)
+
+        # Throttle seeks requested while dragging the progress slider to one every 40ms
+        self.seekTimer = QTimer(self)
+        self.seekTimer.setSingleShot(True)
+        self.seekTimer.setInterval(40)
+        self.seekTimer.timeout.connect(self.seekSlider)
+
+        # Debounce extractions triggered by successive selections
+        self.extractTimer = QTimer(self)
+        self.extractTimer.setSingleShot(True)
+        self.extractTimer.setInterval(200)
+        self.extractTimer.timeout.connect(self.extractSelection)
+
+        self.videoFrameRate = 30.0
+        self.frameDuration = 1000 // 30
         self.hasClickedVideo = False
+        self.helpBox: Optional[HelpBox] = None
+        self.lastExtractKey: Optional[tuple[str, int, int]] = None
+        self.paletteKey: Optional[tuple[QRect, str, int, int]] = None
+        self.pendingPaletteKey: Optional[tuple[QRect, str, int, int]] = None
         self.startGifTime: Optional[int] = None
         self.endGifTime: Optional[int] = None
         self.playbackSpeeds = [0.25, 0.5, 1, 1.5, 2, 3, 4, 8, 16]
         self.currentSpeedIndex = self.playbackSpeeds.index(1)
 
-        # Update progress bar every 15ms
-        self.progressBarTimer = QTimer(self)
-        self.progressBarTimer.setInterval(15)
-        self.progressBarTimer.timeout.connect(self.updateProgressBar)
+        # Update progress bar whenever the player reports a new position
+        self.mediaPlayer.positionChanged.connect(self.updateProgressBar)
+        self.mediaPlayer.durationChanged.connect(self.updateDuration)
+        self.videoDuration = 0
+        self.lastProgressSecond = -1
+
+        # Keyboard shortcuts
+        self.ctrlKeyActions: dict[int, Callable[[], None]] = {
+            Qt.Key.Key_O: self.openVideo,
+            Qt.Key.Key_S: self.saveGif,
+            Qt.Key.Key_L: self.clearClip,
+        }
+        self.keyActions: dict[int, Callable[[], None]] = {
+            Qt.Key.Key_X: self.saveGif,
+            Qt.Key.Key_Greater: lambda: self.changePlaybackSpeed(1),
+            Qt.Key.Key_Less: lambda: self.changePlaybackSpeed(-1),
+            Qt.Key.Key_Period: lambda: self.stepFrame(1),
+            Qt.Key.Key_Comma: lambda: self.stepFrame(-1),
+            Qt.Key.Key_K: self.togglePlayback,
+            Qt.Key.Key_Space: self.togglePlayback,
+            Qt.Key.Key_Escape: self.stopPlayback,
+            Qt.Key.Key_S: self.markStartFrame,
+            Qt.Key.Key_E: self.markEndFrame,
+            Qt.Key.Key_A: self.gotoStartFrame,
+            Qt.Key.Key_D: self.gotoEndFrame,
+            Qt.Key.Key_P: self.togglePreview,
+            Qt.Key.Key_C: self.clearSelection,
+            Qt.Key.Key_R: self.resetPreviewPos,
+            Qt.Key.Key_Q: self.closeWithConfirm,
+            Qt.Key.Key_Question: self.showHelp,
+        }
 
         self.initUi()
         self.loadVideo(videoPath)
@@ -534,9 +871,6 @@ class VideoPlayer(QMainWindow):
         )
         self.progressSlider.setRange(0, 1000)
         self.sliderSavedStateIsPlaying: Optional[bool] = None
-        self.progressSlider.sliderPressed.connect(self.sliderPressed)
-        self.progressSlider.sliderMoved.connect(self.sliderMoved)
-        self.progressSlider.sliderReleased.connect(self.sliderReleased)
         progressLayout.addWidget(self.progressSlider)
 
         self.totalTimeLabel = QLabel("00:00", self)
@@ -553,7 +887,9 @@ class VideoPlayer(QMainWindow):
         self.openButton.clicked.connect(self.openVideo)
         controlLayout.addWidget(self.openButton)
 
-        self.playButton = QPushButton(QIcon.fromTheme("media-playback-start"), None, self)
+        self.playIcon = QIcon.fromTheme("media-playback-start")
+        self.pauseIcon = QIcon.fromTheme("media-playback-pause")
+        self.playButton = QPushButton(self.playIcon, None, self)
         self.playButton.clicked.connect(self.togglePlayback)
         controlLayout.addWidget(self.playButton)
 
@@ -593,6 +929,11 @@ class VideoPlayer(QMainWindow):
 
     def updateBlackBars(self) -> None:
         """Compute the geometry of the video without the black bars"""
+        blackBarsKey = (self.widgetWidth, self.widgetHeight, self.videoWidth, self.videoHeight)
+        if blackBarsKey == self.blackBarsKey:
+            return
+        self.blackBarsKey = blackBarsKey
+
         if self.widgetAspectRatio > self.videoAspectRatio:
             # Black bars on the left and right
             scaledHeight = self.widgetHeight
@@ -608,6 +949,16 @@ class VideoPlayer(QMainWindow):
             yOffset = (self.widgetHeight - scaledHeight) // 2
 
         self.videoTrueGeometry = QRect(xOffset, yOffset, scaledWidth, scaledHeight)
+        self.videoBounds = (xOffset, yOffset, xOffset + scaledWidth, yOffset + scaledHeight)
+
+        # Video pixels per widget pixel, used to map the selection to crop coordinates
+        self.widthRatio = self.videoWidth / max(1, scaledWidth)
+        self.heightRatio = self.videoHeight / max(1, scaledHeight)
+
+    def isInVideo(self, pos: QPoint) -> bool:
+        """Hit-test against the cached video bounds, called on every mouse event"""
+        x0, y0, x1, y1 = self.videoBounds
+        return x0 <= pos.x() < x1 and y0 <= pos.y() < y1
 
     def setSelectOverlayPos(self) -> None:
         """Set the position of the selection overlay to the video geometry"""
@@ -616,7 +967,15 @@ class VideoPlayer(QMainWindow):
 
         self.updateBlackBars()
         globalPos = self.videoWidget.mapToGlobal(self.videoTrueGeometry.topLeft())
-        self.selectionWindow.setGeometry(QRect(globalPos, self.videoTrueGeometry.size()))
+        overlayGeometry = QRect(globalPos, self.videoTrueGeometry.size())
+        if overlayGeometry == self.selectionWindow.geometry() and self.selectionWindow.isVisible():
+            return
+
+        # Moving the main window only shifts the overlay, skip the resize in that case
+        if overlayGeometry.size() == self.selectionWindow.size():
+            self.selectionWindow.move(globalPos)
+        else:
+            self.selectionWindow.setGeometry(overlayGeometry)
         self.selectionWindow.show()
 
     def setPreviewPos(self) -> None:
@@ -644,7 +1003,10 @@ class VideoPlayer(QMainWindow):
 
         self.previewRelGeometry = QRect(topLeftPos, QSize(previewWidth, previewHeight))
         globalPos = self.videoWidget.mapToGlobal(topLeftPos)
-        self.previewWindow.setGeometry(QRect(globalPos, QSize(previewWidth, previewHeight)))
+        if self.previewRelGeometry.size() == self.previewWindow.size():
+            self.previewWindow.move(globalPos)
+        else:
+            self.previewWindow.setGeometry(QRect(globalPos, self.previewRelGeometry.size()))
         if self.previewEnabled:
             self.previewWindow.show()
 
@@ -654,7 +1016,7 @@ class VideoPlayer(QMainWindow):
             return
 
         self.previewAnchor = None
-        self.selectionWindow.clearSelection()
+        self.clearSelection()
         self.widgetWidth = self.videoWidget.width()
         self.widgetHeight = self.videoWidget.height()
         self.widgetAspectRatio = self.widgetWidth / self.widgetHeight
@@ -666,6 +1028,15 @@ class VideoPlayer(QMainWindow):
         self.setSelectOverlayPos()
         self.setPreviewPos()
 
+    def changeEvent(self, a0: Optional[QEvent]) -> None:
+        super().changeEvent(a0)
+        if a0 is None or a0.type() != QEvent.Type.WindowStateChange or not hasattr(self, "isLoaded"):
+            return
+
+        # Progress updates are skipped while minimized, catch up when the window is restored
+        if not self.isMinimized() and self.isLoaded:
+            self.updateProgressBar(self.mediaPlayer.position())
+
     def openVideo(self) -> None:
         filePath, _ = QFileDialog.getOpenFileName(
             self, "Open Video", "", "Video Files (*.mp4 *.avi *.mkv)",
@@ -673,15 +1044,18 @@ class VideoPlayer(QMainWindow):
         self.loadVideo(filePath)
 
     def loadVideo(self, filePath: Optional[str]) -> None:
-        self.isLoaded = False
-        self.stopPlayback()
-        if filePath is None:
+        # Keep the current media and its decoder alive if the dialog was cancelled
+        if not filePath:
             return
 
         if not Path(filePath).is_file():
             self.statusLabel.setText(f"No such file {filePath}")
             return
 
+        self.isLoaded = False
+        self.stopPlayback()
+        self.thumbnailWorker.interrupt()
+        self.progressSlider.clearThumbnails()
         self.mediaPlayer.setSource(QUrl.fromLocalFile(str(filePath)))
         self.statusLabel.setText("Loading media...")
 
@@ -692,12 +1066,20 @@ class VideoPlayer(QMainWindow):
         self.statusLabel.setText("Media loaded!")
         self.isLoaded = True
         self.togglePlayback()
-        self.totalTimeLabel.setText(format_time(self.mediaPlayer.duration() // 1000))
-        self.progressBarTimer.start()
-        self.videoWidth = self.mediaPlayer.metaData().value(QMediaMetaData.Key.Resolution).width()
-        self.videoHeight = self.mediaPlayer.metaData().value(QMediaMetaData.Key.Resolution).height()
+        self.updateDuration(self.mediaPlayer.duration())
+        self.progressSlider.clearTicks()
+        self.lastProgressSecond = -1
+        self.updateProgressBar(self.mediaPlayer.position())
+        self.videoPath = self.mediaPlayer.source().path()
+        metaData = self.mediaPlayer.metaData()
+        resolution = metaData.value(QMediaMetaData.Key.Resolution)
+        self.videoWidth = resolution.width()
+        self.videoHeight = resolution.height()
         self.videoAspectRatio = self.videoWidth / self.videoHeight
+        self.videoFrameRate = metaData.value(QMediaMetaData.Key.VideoFrameRate) or 30.0
+        self.frameDuration = max(1, round(1000 / self.videoFrameRate))
         self.setSelectOverlayPos()
+        self.generateThumbnails()
 
     def sliderPressed(self) -> None:
         if not self.isLoaded:
@@ -712,28 +1094,50 @@ class VideoPlayer(QMainWindow):
         if not self.isLoaded:
             return
 
-        newPosition = self.progressSlider.value() * self.mediaPlayer.duration() // 1000
-        self.mediaPlayer.setPosition(newPosition)
+        # Seeks while dragging are coalesced, the latest slider value wins
+        if not self.seekTimer.isActive():
+            self.seekTimer.start()
+
+    def seekSlider(self) -> None:
+        self.mediaPlayer.setPosition(self.progressSlider.value())
 
     def sliderReleased(self) -> None:
         if not self.isLoaded:
             return
 
+        # Always land on the exact release position
+        self.seekTimer.stop()
+        self.seekSlider()
         if self.sliderSavedStateIsPlaying:
             self.mediaPlayer.play()
         self.sliderSavedStateIsPlaying = None
+        self.updateProgressBar(self.mediaPlayer.position())
 
     def toggleOptimizationField(self) -> None:
         status = not self.optimizationField.isEnabled()
         self.optimizationField.setEnabled(status)
         self.optimizationLabel.setEnabled(status)
 
-    def updateProgressBar(self) -> None:
-        if self.sliderSavedStateIsPlaying is not None or self.mediaPlayer.duration() <= 0:
+    def updateDuration(self, duration: int) -> None:
+        self.videoDuration = duration
+        self.totalTimeLabel.setText(format_time(duration // 1000))
+        self.progressSlider.setRange(0, duration)
+
+    def updateProgressBar(self, position: int) -> None:
+        if self.sliderSavedStateIsPlaying is not None or not self.isLoaded or self.isMinimized():
             return
-        progress = self.mediaPlayer.position() / self.mediaPlayer.duration() * 1000
-        self.progressSlider.setValue(int(progress))
-        self.currTimeLabel.setText(format_time(self.mediaPlayer.position() // 1000))
+
+        # The slider range is the video duration in ms, no need to emit valueChanged
+        # as the update comes from the player itself
+        self.progressSlider.blockSignals(True)
+        self.progressSlider.setValue(position)
+        self.progressSlider.blockSignals(False)
+
+        # Only touch the label when the displayed second actually changes
+        second = position // 1000
+        if second != self.lastProgressSecond:
+            self.lastProgressSecond = second
+            self.currTimeLabel.setText(format_time(second))
 
     def togglePlayback(self) -> None:
         if self.mediaPlayer.mediaStatus() == QMediaPlayer.MediaStatus.NoMedia:
@@ -741,16 +1145,16 @@ class VideoPlayer(QMainWindow):
 
         if self.mediaPlayer.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             self.mediaPlayer.pause()
-            self.playButton.setIcon(QIcon.fromTheme("media-playback-start"))
+            self.playButton.setIcon(self.playIcon)
         else:
             self.mediaPlayer.play()
-            self.playButton.setIcon(QIcon.fromTheme("media-playback-pause"))
+            self.playButton.setIcon(self.pauseIcon)
 
     def stopPlayback(self) -> None:
         self.mediaPlayer.stop()
-        self.playButton.setIcon(QIcon.fromTheme("media-playback-start"))
+        self.playButton.setIcon(self.playIcon)
         self.selectionWindow.hide()
-        self.selectionWindow.clearSelection()
+        self.clearSelection()
         self.previewWindow.stop()
         self.previewWindow.hide()
         self.startGifTime = None
@@ -759,11 +1163,11 @@ class VideoPlayer(QMainWindow):
 
     def seekRelative(self, milliseconds: int) -> None:
         newPosition = self.mediaPlayer.position() + milliseconds
-        newPosition = max(0, min(newPosition, self.mediaPlayer.duration()))
+        newPosition = max(0, min(newPosition, self.videoDuration))
         self.mediaPlayer.setPosition(newPosition)
 
     def seekPercent(self, percent: int) -> None:
-        newPosition = int(self.mediaPlayer.duration() * percent / 10)
+        newPosition = self.videoDuration * percent // 10
         self.mediaPlayer.setPosition(newPosition)
 
     def changePlaybackSpeed(self, direction: int) -> None:
@@ -777,8 +1181,7 @@ class VideoPlayer(QMainWindow):
     def stepFrame(self, direction: int) -> None:
         self.mediaPlayer.pause()
         currentPosition = self.mediaPlayer.position()
-        frameDuration = 1000 // 30  # Assuming 30 FPS
-        self.mediaPlayer.setPosition(int(currentPosition + direction * frameDuration))
+        self.mediaPlayer.setPosition(currentPosition + direction * self.frameDuration)
 
     def markStartFrame(self) -> None:
         if self.isLoaded and self.mediaPlayer.playbackState() != QMediaPlayer.PlaybackState.StoppedState:
@@ -788,10 +1191,9 @@ class VideoPlayer(QMainWindow):
                 self.endGifTime = None
                 self.progressSlider.clearTicks()
             self.progressSlider.setStartTick()
-            self.progressSlider.update()
 
             if self.endGifTime is not None:
-                self.gifTrim()
+                self.selectClip()
 
     def markEndFrame(self) -> None:
         if self.isLoaded and self.mediaPlayer.playbackState() != QMediaPlayer.PlaybackState.StoppedState:
@@ -801,10 +1203,9 @@ class VideoPlayer(QMainWindow):
                 self.startGifTime = None
                 self.progressSlider.clearTicks()
             self.progressSlider.setEndTick()
-            self.progressSlider.update()
 
             if self.startGifTime is not None:
-                self.gifTrim()
+                self.selectClip()
 
     def gotoStartFrame(self) -> None:
         if self.startGifTime is not None:
@@ -814,51 +1215,79 @@ class VideoPlayer(QMainWindow):
         if self.endGifTime is not None:
             self.mediaPlayer.setPosition(self.endGifTime)
 
-    def getCropCoords(self) -> str:
+    def getCropRect(self) -> QRect:
+        """Returns the selection in video pixels"""
         sel = cast(QRect, self.selectionWindow.getRect())
 
-        widthRatio = self.videoWidth / self.videoTrueGeometry.width()
-        heightRatio = self.videoHeight / self.videoTrueGeometry.height()
+        widthRatio, heightRatio = self.widthRatio, self.heightRatio
         x = int(sel.x() * widthRatio)
         y = int(sel.y() * heightRatio)
         w = int(sel.width() * widthRatio)
         h = int(sel.height() * heightRatio)
-        return f"{w}:{h}:{x}:{y}"
+        return QRect(x, y, w, h)
+
+    def getCropCoords(self) -> str:
+        crop = self.getCropRect()
+        return f"{crop.width()}:{crop.height()}:{crop.x()}:{crop.y()}"
+
+    def canReusePalette(self, crop: QRect) -> bool:
+        """Whether the last generated palette was computed on nearly the same pixels"""
+        if self.paletteKey is None or not TMP_PALETTE_FILE.exists():
+            return False
 
-    def gifTrim(self) -> None:
+        paletteCrop, videoPath, startGifTime, endGifTime = self.paletteKey
+        if (videoPath, startGifTime, endGifTime) != (self.videoPath, self.startGifTime, self.endGifTime):
+            return False
+
+        overlap = paletteCrop.intersected(crop)
+        maxArea = max(paletteCrop.width() * paletteCrop.height(), crop.width() * crop.height())
+        return overlap.width() * overlap.height() >= PALETTE_REUSE_OVERLAP * maxArea
+
+    def selectClip(self) -> None:
         if self.startGifTime is None or self.endGifTime is None:
             return
-        self.statusLabel.setText("Trimming video...")
+        self.statusLabel.setText("Clip selected!")
 
         # Stop preview generation when user has selected another clip
         self.previewWorker.interrupt()
+        self.lastExtractKey = None
 
-        filePath = self.mediaPlayer.source().path()
-        startTimeStr = f"{format_time(self.startGifTime // 1000)}.{self.startGifTime % 1000}"
+        # Nb frames = fps * clipLength (in s)
         clipLength = self.endGifTime - self.startGifTime
-        lengthStr = f"{format_time(clipLength // 1000)}.{clipLength % 1000}"
+        self.clipNbFrames = int(self.videoFrameRate * clipLength / 1000)
 
-        # Nb frames = 30fps * clipLength (in s)
-        self.clipNbFrames = 30 * clipLength // 1000
+        self.gifPreview()
+        self.gifConversion()
 
-        trimCmd = ["ffmpeg", "-y", "-an", "-ss", startTimeStr, "-t", lengthStr,
-                   "-i", filePath, "-c", "copy", str(TMP_MP4_TRIM_FILE)]
-        self.trimWorker.run(trimCmd)
+    def clipInputArgs(self) -> list[str]:
+        """Input options decoding only the selected clip straight from the video"""
+        startGifTime, endGifTime = cast(int, self.startGifTime), cast(int, self.endGifTime)
+        return ["-ss", format_ffmpeg_time(startGifTime), "-t", format_ffmpeg_time(endGifTime - startGifTime),
+                "-i", self.videoPath]
 
     def gifPreview(self) -> None:
-        if not TMP_MP4_TRIM_FILE.exists() or not self.selectionWindow.isValid():
+        if self.startGifTime is None or self.endGifTime is None or not self.selectionWindow.isValid():
             return
 
         cropCoords = self.getCropCoords()
         self.selectionWindow.validate()
         self.selectionWindow.update()
 
-        previewCmd = ["ffmpeg", "-y", "-i", str(TMP_MP4_TRIM_FILE),
-                      "-vf", f"crop={cropCoords}", str(TMP_PREVIEW_FILE)]
+        # Generate the palette once on the cropped stream so that paletteuse only does LUT lookups
+        filterStr = (
+            f"[0:v] crop={cropCoords}, split [a][b];"
+            " [a] palettegen=max_colors=128:stats_mode=diff [p];"
+            " [b] [p] paletteuse=dither=bayer:bayer_scale=5"
+        )
+
+        previewCmd = ["ffmpeg", "-y", *self.hwaccelArgs, *self.clipInputArgs(),
+                      "-an", "-filter_complex", filterStr, "-f", "gif", "pipe:1"]
+        # The preview GIF is streamed on stdout and decoded from memory
+        self.previewData = bytearray()
         self.previewWorker.run(previewCmd)
 
     def gifConversion(self) -> None:
-        if not TMP_MP4_TRIM_FILE.exists() or not self.selectionWindow.isValid():
+        if self.startGifTime is None or self.endGifTime is None or not self.selectionWindow.isValid():
             return
 
         self.statusLabel.setText("Converting video...")
@@ -867,17 +1296,34 @@ class VideoPlayer(QMainWindow):
         self.optimizationWorker.interrupt()
         TMP_OUTPUT_FILE.unlink(missing_ok=True)
 
+        crop = self.getCropRect()
         cropCoords = self.getCropCoords()
-        filterStr = (
-            f"crop={cropCoords}, split [s0][s1];"
-            " [s0] palettegen=max_colors=64:stats_mode=diff [pal];"
-            " [s1] fifo [s1] ; [s1] [pal] paletteuse=dither=bayer"
-        )
+        self.lastExtractKey = (cropCoords, self.startGifTime, self.endGifTime)
+
+        if self.canReusePalette(crop):
+            # Small adjustments of the selection keep the previous palette and skip palettegen
+            self.pendingPaletteKey = None
+            paletteInputArgs = ["-i", str(TMP_PALETTE_FILE)]
+            filterStr = f"[0:v] crop={cropCoords} [s1]; [s1] [1:v] paletteuse=dither=bayer [gif]"
+            paletteOutputArgs = []
+        else:
+            # The palette is also saved to be reused by the next conversions of this clip
+            TMP_PALETTE_FILE.unlink(missing_ok=True)
+            self.paletteKey = None
+            self.pendingPaletteKey = (crop, self.videoPath, self.startGifTime, self.endGifTime)
+            paletteInputArgs = []
+            filterStr = (
+                f"[0:v] crop={cropCoords}, split [s0][s1];"
+                " [s0] palettegen=max_colors=64:stats_mode=diff, split [pal][palout];"
+                " [s1] fifo [s1] ; [s1] [pal] paletteuse=dither=bayer [gif]"
+            )
+            paletteOutputArgs = ["-map", "[palout]", "-update", "1", str(TMP_PALETTE_FILE)]
 
-        conversionCmd = ["ffmpeg", "-y", "-v", "quiet", "-progress", "pipe:1",
-                         "-i", str(TMP_MP4_TRIM_FILE), "-vf", filterStr, str(TMP_OUTPUT_FILE)]
-        self.extractionRunning = True
-        self.conversionWorker.run(conversionCmd)
+        conversionCmd = ["ffmpeg", "-y", "-v", "quiet", "-progress", "pipe:1", "-nostats",
+                         *self.hwaccelArgs, *self.clipInputArgs(), *paletteInputArgs,
+                         "-filter_complex", filterStr, "-map", "[gif]", str(TMP_OUTPUT_FILE),
+                         *paletteOutputArgs]
+        self.conversionWorker.run(lowPriority(conversionCmd))
 
     def gifOptimization(self) -> None:
         if not TMP_OUTPUT_FILE.exists():
@@ -890,26 +1336,48 @@ class VideoPlayer(QMainWindow):
         self.statusLabel.setText("Optimizing GIF, this can take a while...")
         optimizationCmd = ["gifsicle", "-O3", f"--lossy={self.optimizationField.value()}",
                            "-o", str(TMP_OUTPUT_FILE), str(TMP_OUTPUT_FILE)]
-        self.optimizationWorker.run(optimizationCmd)
-
-    def onTrimFinished(self, status: WorkerStatus, msg: str) -> None:
-        if status == WorkerStatus.SUCCESS:
-            self.statusLabel.setText("Video trimmed!")
-            self.gifPreview()
-            self.gifConversion()
-
-        elif status == WorkerStatus.FAILURE:
-            self.extractionRunning = False
-            self.statusLabel.setText("Something went wrong when trimming file")
+        self.optimizationWorker.run(lowPriority(optimizationCmd))
 
-        elif status == WorkerStatus.ERROR:
-            self.extractionRunning = False
-            self.statusLabel.setText(f"Error occured in worker task: {msg}")
+    def onPreviewData(self, data: bytes) -> None:
+        self.previewData += data
 
     def onPreviewFinished(self, status: WorkerStatus, _: str) -> None:
         if status == WorkerStatus.SUCCESS:
-            self.previewWindow.loadGif(str(TMP_PREVIEW_FILE))
+            self.previewWindow.loadGif(bytes(self.previewData))
+            # Frames are decoded once, after the window has been resized to fit the new GIF
             self.setPreviewPos()
+            self.previewWindow.play()
+        self.previewData = bytearray()
+
+    def generateThumbnails(self) -> None:
+        """Decode all the slider thumbnails in a single ffmpeg pass streaming JPEGs on stdout"""
+        self.progressSlider.clearThumbnails()
+        self.thumbnailData = bytearray()
+        if self.videoDuration <= 0:
+            return
+
+        thumbnailFilter = f"fps={THUMBNAIL_COUNT * 1000}/{self.videoDuration},scale={THUMBNAIL_WIDTH}:-2"
+        # Only keyframes are decoded, at a low priority as this runs alongside the playback
+        thumbnailCmd = ["ffmpeg", "-v", "quiet", *self.hwaccelArgs, "-skip_frame", "nokey", "-i", self.videoPath,
+                        "-an", "-vf", thumbnailFilter, "-f", "image2pipe", "-c:v", "mjpeg", "-q:v", "5", "pipe:1"]
+        self.thumbnailWorker.run(lowPriority(thumbnailCmd))
+
+    def onThumbnailData(self, data: bytes) -> None:
+        # Split the MJPEG stream on the JPEG end-of-image marker
+        self.thumbnailData += data
+        while (end := self.thumbnailData.find(b"\xff\xd9")) >= 0:
+            thumbnail = QPixmap()
+            thumbnail.loadFromData(bytes(self.thumbnailData[:end + 2]), "JPG")
+            del self.thumbnailData[:end + 2]
+            self.progressSlider.thumbnails.append(thumbnail)
+
+    def onThumbnailsFinished(self, status: WorkerStatus, _: str) -> None:
+        self.thumbnailData = bytearray()
+        if status == WorkerStatus.SUCCESS:
+            # The fps filter can round the number of frames, map the slider on the actual count
+            self.progressSlider.thumbnailCount = len(self.progressSlider.thumbnails)
+        else:
+            self.progressSlider.clearThumbnails()
 
     def onConversionProgress(self, frame: int, fps: float) -> None:
         try:
@@ -923,20 +1391,22 @@ class VideoPlayer(QMainWindow):
 
     def onConversionFinished(self, status: WorkerStatus, msg: str) -> None:
         if status == WorkerStatus.SUCCESS:
+            if self.pendingPaletteKey is not None:
+                self.paletteKey = self.pendingPaletteKey
             if self.optimizationBox.isChecked():
                 self.gifOptimization()
             else:
-                self.extractionRunning = False
                 self.statusLabel.setText("Gif extracted successfully!")
 
         elif status == WorkerStatus.FAILURE:
+            self.lastExtractKey = None
             self.statusLabel.setText("Something went wrong when converting file")
 
         elif status == WorkerStatus.ERROR:
+            self.lastExtractKey = None
             self.statusLabel.setText(f"Error occured in worker task: {msg}")
 
     def onOptimizationFinished(self, status: WorkerStatus, msg: str) -> None:
-        self.extractionRunning = False
         if status == WorkerStatus.SUCCESS:
             self.statusLabel.setText("Gif extracted successfully!")
 
@@ -947,11 +1417,11 @@ class VideoPlayer(QMainWindow):
             self.statusLabel.setText(f"Error occured in worker task: {msg}")
 
     def saveGif(self) -> None:
-        if self.conversionWorker.worker is not None:
+        if self.conversionWorker.isRunning():
             self.statusLabel.setText("GIF is converting!")
             return
 
-        if self.optimizationWorker.worker is not None:
+        if self.optimizationWorker.isRunning():
             self.statusLabel.setText("Clip is being optimized, this can take a while...")
             return
 
@@ -966,101 +1436,70 @@ class VideoPlayer(QMainWindow):
         if not filePath.endswith(".gif"):
             filePath += ".gif"
 
-        TMP_OUTPUT_FILE.rename(filePath)
+        try:
+            # Renaming is zero-copy but only works within a single filesystem
+            TMP_OUTPUT_FILE.replace(filePath)
+        except OSError:
+            shutil.copyfile(TMP_OUTPUT_FILE, filePath)
+            TMP_OUTPUT_FILE.unlink()
         self.statusLabel.setText("Gif saved!")
 
+    def clearSelection(self) -> None:
+        # A pending extraction would otherwise validate the cleared selection
+        self.extractTimer.stop()
+        self.selectionWindow.clearSelection()
+
+    def clearClip(self) -> None:
+        self.clearSelection()
+        self.startGifTime = None
+        self.endGifTime = None
+        self.progressSlider.clearTicks()
+        self.previewAnchor = None
+        self.setPreviewPos()
+        self.previewWindow.stop()
+        self.previewWindow.hide()
+
+    def togglePreview(self) -> None:
+        self.previewEnabled = not self.previewEnabled
+        self.previewWindow.toggle()
+
+    def resetPreviewPos(self) -> None:
+        self.previewAnchor = None
+        self.setPreviewPos()
+
     def keyPressEvent(self, a0: Optional[QKeyEvent]) -> None:
         if not a0:
             return
         key = a0.key()
+        modifiers = a0.modifiers()
 
-        if key == Qt.Key.Key_O and a0.modifiers() & Qt.KeyboardModifier.ControlModifier:
-            self.openVideo()
-
-        elif (
-            key == Qt.Key.Key_S and a0.modifiers() & Qt.KeyboardModifier.ControlModifier
-            or key == Qt.Key.Key_X
-        ):
-            self.saveGif()
-
-        elif key == Qt.Key.Key_L and a0.modifiers() & Qt.KeyboardModifier.ControlModifier:
-            self.selectionWindow.clearSelection()
-            self.startGifTime = None
-            self.endGifTime = None
-            self.progressSlider.clearTicks()
-            self.previewAnchor = None
-            self.setPreviewPos()
-            self.previewWindow.stop()
-            self.previewWindow.hide()
+        # Keys whose action depends on modifiers are handled first
+        if modifiers & Qt.KeyboardModifier.ControlModifier and key in self.ctrlKeyActions:
+            self.ctrlKeyActions[key]()
 
-        elif key in [Qt.Key.Key_J, Qt.Key.Key_L, Qt.Key.Key_Left, Qt.Key.Key_Right]:
+        elif key in {Qt.Key.Key_J, Qt.Key.Key_L, Qt.Key.Key_Left, Qt.Key.Key_Right}:
             sign = 1 if key == Qt.Key.Key_L or key == Qt.Key.Key_Right else -1
-            if a0.modifiers() & Qt.KeyboardModifier.AltModifier:
+            if modifiers & Qt.KeyboardModifier.AltModifier:
                 delay = 100
-            elif a0.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+            elif modifiers & Qt.KeyboardModifier.ShiftModifier:
                 delay = 1000
             else:
                 delay = 3000
             self.seekRelative(sign * delay)
 
-        elif key == Qt.Key.Key_Greater:
-            self.changePlaybackSpeed(1)
-
-        elif key == Qt.Key.Key_Less:
-            self.changePlaybackSpeed(-1)
-
-        elif key == Qt.Key.Key_Period:
-            self.stepFrame(1)
-
-        elif key == Qt.Key.Key_Comma:
-            self.stepFrame(-1)
-
-        elif a0.text().isdigit():
-            self.seekPercent(int(a0.text()))
-
-        elif key in {Qt.Key.Key_K, Qt.Key.Key_Space}:
-            self.togglePlayback()
-
-        elif key == Qt.Key.Key_Escape:
-            self.stopPlayback()
-
-        elif key == Qt.Key.Key_S:
-            self.markStartFrame()
+        elif Qt.Key.Key_0 <= key <= Qt.Key.Key_9:
+            self.seekPercent(key - Qt.Key.Key_0)
 
-        elif key == Qt.Key.Key_E:
-            self.markEndFrame()
-
-        elif key == Qt.Key.Key_A:
-            self.gotoStartFrame()
-
-        elif key == Qt.Key.Key_D:
-            self.gotoEndFrame()
-
-        elif key == Qt.Key.Key_P:
-            self.previewEnabled = not self.previewEnabled
-            self.previewWindow.toggle()
-
-        elif key == Qt.Key.Key_C:
-            self.selectionWindow.clearSelection()
-
-        elif key == Qt.Key.Key_R:
-            self.previewAnchor = None
-            self.setPreviewPos()
-
-        elif key == Qt.Key.Key_Q:
-            self.closeWithConfirm()
-
-        elif key == Qt.Key.Key_Question:
-            self.showHelp()
+        elif key in self.keyActions:
+            self.keyActions[key]()
 
     def cropAnchor(self, anchor: QPoint) -> QPoint:
-        vx = self.videoWidget.geometry().width()
+        # Widget size is cached on resize as this is called on every mouse move
         dx = self.previewRelGeometry.width()
-        x = max(0, min(anchor.x(), vx - dx))
+        x = max(0, min(anchor.x(), self.widgetWidth - dx))
 
-        vy = self.videoWidget.geometry().height()
         dy = self.previewRelGeometry.height()
-        y = max(0, min(anchor.y(), vy - dy))
+        y = max(0, min(anchor.y(), self.widgetHeight - dy))
 
         return QPoint(x, y)
 
@@ -1072,7 +1511,7 @@ class VideoPlayer(QMainWindow):
         self.optimizationField.clearFocus()
 
         if a0.button() == Qt.MouseButton.MiddleButton:
-            self.selectionWindow.clearSelection()
+            self.clearSelection()
             return
 
         if a0.button() != Qt.MouseButton.LeftButton:
@@ -1084,13 +1523,15 @@ class VideoPlayer(QMainWindow):
             return
 
         # Click outside of video widget
-        if not self.videoTrueGeometry.contains(a0.pos()):
+        if not self.isInVideo(a0.pos()):
             return
 
+        # Cancel the extraction of the previous selection as a new one is being drawn
+        self.extractTimer.stop()
         self.hasClickedVideo = True
-        self.selectionWindow.startPos = a0.pos() - self.videoTrueGeometry.topLeft()
-        self.selectionWindow.endPos = None
-        self.selectionWindow.update()
+        self.selectionWindow.setStartPos(a0.pos() - self.videoTrueGeometry.topLeft())
+        self.selectionWindow.setEndPos(None)
+        self.selectionWindow.updateSelection()
 
     def mouseMoveEvent(self, a0: Optional[QMouseEvent]) -> None:
         super().mouseMoveEvent(a0)
@@ -1101,38 +1542,61 @@ class VideoPlayer(QMainWindow):
         if self.clickPreviewVec is not None and self.previewWindow.isVisible():
             self.previewAnchor = self.cropAnchor(a0.pos() + self.clickPreviewVec)
             self.previewRelGeometry.moveTopLeft(self.previewAnchor)
-            globalPos = self.videoWidget.mapToGlobal(self.previewAnchor)
-            self.previewWindow.setGeometry(QRect(globalPos, self.previewRelGeometry.size()))
+            if not self.previewMoveTimer.isActive():
+                self.previewMoveTimer.start()
             return
 
         # Move outside of video widget
-        if not self.hasClickedVideo or not self.videoTrueGeometry.contains(a0.pos()):
+        if not self.hasClickedVideo or not self.isInVideo(a0.pos()):
             return
 
         self.previewWindow.hide()
-        self.selectionWindow.endPos = a0.pos() - self.videoTrueGeometry.topLeft()
-        self.selectionWindow.update()
+        self.selectionWindow.setEndPos(a0.pos() - self.videoTrueGeometry.topLeft())
+        if not self.selectionUpdateTimer.isActive():
+            self.selectionUpdateTimer.start()
+
+    def movePreview(self) -> None:
+        """Move the preview window to the latest anchor set while dragging it"""
+        if self.previewAnchor is None:
+            return
+
+        self.previewWindow.move(self.videoWidget.mapToGlobal(self.previewAnchor))
 
     def mouseReleaseEvent(self, a0: Optional[QMouseEvent]) -> None:
         super().mouseMoveEvent(a0)
+        self.clickPreviewVec = None
         if a0 is None or not self.hasClickedVideo:
             return
 
         self.hasClickedVideo = False
-        self.clickPreviewVec = None
 
-        self.selectionWindow.update()
+        self.selectionUpdateTimer.stop()
+        self.selectionWindow.updateSelection()
+
+        # Only extract once the user has stopped adjusting the selection
+        self.extractTimer.start()
+
+    def extractSelection(self) -> None:
+        if self.startGifTime is None or self.endGifTime is None or not self.selectionWindow.isValid():
+            return
+
+        # Skip the extraction if the clip has already been converted with this selection
+        if (self.getCropCoords(), self.startGifTime, self.endGifTime) == self.lastExtractKey:
+            return
 
         self.gifPreview()
         self.gifConversion()
 
+    def isExtractionRunning(self) -> bool:
+        return self.conversionWorker.isRunning() or self.optimizationWorker.isRunning()
+
     def closeWithConfirm(self) -> None:
-        if not self.extractionRunning and not TMP_OUTPUT_FILE.exists():
+        if not self.isExtractionRunning() and not TMP_OUTPUT_FILE.exists():
             self.close()
             return
 
         confirmBox = QMessageBox()
-        if self.extractionRunning:
+        if self.isExtractionRunning():
             msg = "A GIF is being extracted right now, do you want to quit anyway?"
         else:
             msg = "A GIF has been extracted but not saved, do you want to quit anyway?"
@@ -1149,51 +1613,51 @@ class VideoPlayer(QMainWindow):
         self.selectionWindow.close()
         self.previewWindow.close()
 
-        self.trimWorker.close()
-        self.previewWorker.close()
-        self.conversionWorker.close()
-        self.optimizationWorker.close()
+        for worker in self.workers:
+            worker.close()
 
-        TMP_MP4_TRIM_FILE.unlink(missing_ok=True)
-        TMP_PREVIEW_FILE.unlink(missing_ok=True)
         TMP_OUTPUT_FILE.unlink(missing_ok=True)
+        TMP_PALETTE_FILE.unlink(missing_ok=True)
 
         os.system("stty sane")
         super().closeEvent(a0)
 
     def showHelp(self) -> None:
         """Display a help box with keybindings."""
-        helpBox = HelpBox(self)
-        helpBox.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Tool)
-        helpBox.setText(
-            "<b>Hotkeys:</b><br>"
-            "<b>&lt;C-O></b>: Open video<br>"
-            "<b>&lt;C-S></b> / <b>X</b>: Save clip<br>"
-            "<b>Space</b> / <b>K</b>: Play/pause<br>"
-            "<b>, </b>: Previous frame<br>"
-            "<b>. </b>: Next frame<br>"
-            "<b>> </b>: Increase playback speed<br>"
-            "<b>&lt; </b>: Decrease playback speed<br>"
-            "<b>L</b> / <b>Right</b>: Go +3s<br>"
-            "<b>J</b> / <b>Left</b>: Go -3s<br>"
-            "<b>&lt;C-L></b> / <b>&lt;C-Right></b>: Go +1s<br>"
-            "<b>&lt;C-J></b> / <b>&lt;C-Left></b>: Go -1s<br>"
-            "<b>&lt;M-L></b> / <b>&lt;M-Right></b>: Go +0.1s<br>"
-            "<b>&lt;M-J></b> / <b>&lt;M-Left></b>: Go -0.1s<br>"
-            "<b>[n]</b>: Go to [n]% of the video<br>"
-            "<b>S</b>: Mark start frame<br>"
-            "<b>E</b>: Mark end frame<br>"
-            "<b>A</b>: Go to start frame<br>"
-            "<b>D</b>: Go to end frame<br>"
-            "<b>C</b>: Clear selection<br>"
-            "<b>P</b>: Toggle preview<br>"
-            "<b>R</b>: Reset preview<br>"
-            "<b>&lt;C-l></b>: Clear selection and preview<br>"
-            "<b>Q</b>: Quit<br>"
-            "<b>Escape</b>: Stop playback<br>"
-            "<b>?</b>: Toggle this help<br>"
-        )
-        helpBox.exec()
+        # The box is built once and reused as its text never changes
+        if self.helpBox is None:
+            helpBox = HelpBox(self)
+            helpBox.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.Tool)
+            helpBox.setText(
+                "<b>Hotkeys:</b><br>"
+                "<b>&lt;C-O></b>: Open video<br>"
+                "<b>&lt;C-S></b> / <b>X</b>: Save clip<br>"
+                "<b>Space</b> / <b>K</b>: Play/pause<br>"
+                "<b>, </b>: Previous frame<br>"
+                "<b>. </b>: Next frame<br>"
+                "<b>> </b>: Increase playback speed<br>"
+                "<b>&lt; </b>: Decrease playback speed<br>"
+                "<b>L</b> / <b>Right</b>: Go +3s<br>"
+                "<b>J</b> / <b>Left</b>: Go -3s<br>"
+                "<b>&lt;C-L></b> / <b>&lt;C-Right></b>: Go +1s<br>"
+                "<b>&lt;C-J></b> / <b>&lt;C-Left></b>: Go -1s<br>"
+                "<b>&lt;M-L></b> / <b>&lt;M-Right></b>: Go +0.1s<br>"
+                "<b>&lt;M-J></b> / <b>&lt;M-Left></b>: Go -0.1s<br>"
+                "<b>[n]</b>: Go to [n]% of the video<br>"
+                "<b>S</b>: Mark start frame<br>"
+                "<b>E</b>: Mark end frame<br>"
+                "<b>A</b>: Go to start frame<br>"
+                "<b>D</b>: Go to end frame<br>"
+                "<b>C</b>: Clear selection<br>"
+                "<b>P</b>: Toggle preview<br>"
+                "<b>R</b>: Reset preview<br>"
+                "<b>&lt;C-l></b>: Clear selection and preview<br>"
+                "<b>Q</b>: Quit<br>"
+                "<b>Escape</b>: Stop playback<br>"
+                "<b>?</b>: Toggle this help<br>"
+            )
+            self.helpBox = helpBox
+        self.helpBox.exec()
         self.activateWindow()  # Ensure main window regains focus
 
 